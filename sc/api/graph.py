@@ -1,22 +1,61 @@
-from fastapi import FastAPI, HTTPException, APIRouter
-from pydantic import BaseModel, Field
-from typing import Dict
+from fastapi import FastAPI, HTTPException, APIRouter, Response
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Dict, List, Tuple
+from functools import lru_cache
 
 from sc.services import ku_graph # Using __init__.py in services to simplify import
 # from sc.api.knowledge import knowledge_units_db # For KU existence check, if needed
 
-# If this is part of a larger FastAPI application, use APIRouter
-# Otherwise, for standalone, use FastAPI()
-# router = APIRouter()
-app = FastAPI(title="Graph API") # Assuming standalone for now, or part of a main app.
+# Endpoints live on a router so the graph and knowledge APIs can be served
+# from one application (see sc/main.py). `app` at the bottom of this module
+# mounts the same router for running the graph API on its own.
+router = APIRouter()
 
 class LinkRequest(BaseModel):
     from_ku_id: str
     to_ku_id: str
     weight: float = Field(..., ge=0.0, le=1.0, description="Link weight, typically between 0.0 and 1.0")
 
-# @router.post("/link", status_code=201)
-@app.post("/api/graph/link", status_code=201)
+class LinkResponse(BaseModel):
+    message: str
+    from_ku_id: str
+    to_ku_id: str
+    weight: float
+
+class BulkLinkResponse(BaseModel):
+    message: str
+    created: int
+
+class LinkTarget(BaseModel):
+    to_ku_id: str
+    weight: float
+
+class OutgoingLinksResponse(BaseModel):
+    ku_id: str
+    links: List[LinkTarget]
+
+AllLinks = Dict[str, List[Tuple[str, float]]]
+_all_links_adapter = TypeAdapter(AllLinks)
+
+# Declaring response models lets FastAPI serialize straight to JSON bytes
+# via pydantic-core instead of going through jsonable_encoder + json.dumps.
+
+# The read endpoints below serve pre-serialized JSON from an LRU cache keyed on
+# the graph version. Any add_link bumps the version, so stale entries are never
+# hit again and simply age out of the cache.
+@lru_cache(maxsize=4096)
+def _outgoing_links_json(ku_id: str, graph_version: int) -> bytes:
+    links = ku_graph.get_links_from(ku_id) or []
+    return OutgoingLinksResponse(
+        ku_id=ku_id,
+        links=[LinkTarget(to_ku_id=target_id, weight=w) for target_id, w in links]
+    ).model_dump_json().encode()
+
+@lru_cache(maxsize=1)
+def _all_links_json(graph_version: int) -> bytes:
+    return _all_links_adapter.dump_json(ku_graph.get_all_links())
+
+@router.post("/link", response_model=LinkResponse, status_code=201)
 async def link_knowledge_units(link_request: LinkRequest):
     """
     Creates a directed link between two Knowledge Units with a specified weight.
@@ -64,8 +103,32 @@ async def link_knowledge_units(link_request: LinkRequest):
         "weight": link_request.weight
     }
 
-# @router.get("/links/{ku_id}")
-@app.get("/api/graph/links/{ku_id}")
+@router.post("/links_bulk", response_model=BulkLinkResponse, status_code=201)
+async def link_knowledge_units_bulk(link_requests: List[LinkRequest]):
+    """
+    Creates or updates many links in one request, e.g. when importing a graph.
+    The whole batch is validated up front and applied all-or-nothing.
+    """
+    self_links = [r.from_ku_id for r in link_requests if r.from_ku_id == r.to_ku_id]
+    if self_links:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot link a Knowledge Unit to itself: {', '.join(self_links)}."
+        )
+
+    success = ku_graph.add_links_bulk(
+        [(r.from_ku_id, r.to_ku_id, r.weight) for r in link_requests]
+    )
+
+    if not success:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to create links. Ensure all weights are valid."
+        )
+
+    return {"message": "Links created successfully", "created": len(link_requests)}
+
+@router.get("/links/{ku_id}", response_model=OutgoingLinksResponse)
 async def get_outgoing_links(ku_id: str):
     """
     Retrieves all outgoing links for a given Knowledge Unit.
@@ -74,19 +137,20 @@ async def get_outgoing_links(ku_id: str):
     # if ku_id not in knowledge_units_db:
     #     raise HTTPException(status_code=404, detail=f"Knowledge Unit with ID '{ku_id}' not found.")
 
-    links = ku_graph.get_links_from(ku_id)
-    if links is None: # KU might exist but have no outgoing links
-        return {"ku_id": ku_id, "links": []}
-
-    return {"ku_id": ku_id, "links": [{"to_ku_id": target_id, "weight": w} for target_id, w in links]}
+    # A KU with no outgoing links (or unknown to the graph) gets an empty list
+    body = _outgoing_links_json(ku_id, ku_graph.get_graph_version())
+    return Response(content=body, media_type="application/json")
 
-# @router.get("/all_links")
-@app.get("/api/graph/all_links")
+@router.get("/all_links", response_model=AllLinks)
 async def get_all_graph_links():
     """
     Retrieves the entire KU graph.
     """
-    return ku_graph.get_all_links()
+    body = _all_links_json(ku_graph.get_graph_version())
+    return Response(content=body, media_type="application/json")
+
+app = FastAPI(title="Graph API")
+app.include_router(router, prefix="/api/graph", tags=["graph"])
 
 # To run this API (example using uvicorn):
 # uvicorn sc.api.graph:app --reload --port 8001
@@ -96,21 +160,16 @@ async def get_all_graph_links():
 # -H "Content-Type: application/json" \
 # -d '{"from_ku_id": "ku_A", "to_ku_id": "ku_B", "weight": 0.85}'
 #
+# Example bulk POST request using curl:
+# curl -X POST "http://127.0.0.1:8001/api/graph/links_bulk" \
+# -H "Content-Type: application/json" \
+# -d '[{"from_ku_id": "ku_A", "to_ku_id": "ku_B", "weight": 0.85}, {"from_ku_id": "ku_B", "to_ku_id": "ku_C", "weight": 0.4}]'
+#
 # Example GET request for specific KU links:
 # curl -X GET "http://127.0.0.1:8001/api/graph/links/ku_A"
 #
 # Example GET request for all links:
 # curl -X GET "http://127.0.0.1:8001/api/graph/all_links"
 
-# Note: If `knowledge.py` and `graph.py` are part of the same overall FastAPI application,
-# you would typically use APIRouter for each and include them in a main app.py.
-# For example, in a main.py:
-# from fastapi import FastAPI
-# from sc.api import knowledge, graph
-#
-# app = FastAPI()
-# app.include_router(knowledge.router, prefix="/api/knowledge", tags=["knowledge"])
-# app.include_router(graph.router, prefix="/api/graph", tags=["graph"])
-#
-# Then, `knowledge.app` and `graph.app` would be `knowledge.router` and `graph.router`.
-# For now, they are independent FastAPI apps for simplicity.
+# To serve the graph and knowledge APIs together on one port, run the combined app:
+# uvicorn sc.main:app --reload --port 8000
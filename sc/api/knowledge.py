@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from pydantic import BaseModel
 from typing import Dict, List, Any
 import time
@@ -8,15 +8,10 @@ from sc.models import KnowledgeUnit
 from sc.services.ku_generator import generate_ku_from_prompt
 from sc.services.flowshield import is_under_attack
 
-# Initialize FastAPI app
-# This will be a sub-application if there's a main app.py,
-# or it can be run directly for this specific API.
-# For now, let's assume it's part of a larger structure.
-# We can use APIRouter if we combine it later.
-# from fastapi import APIRouter
-# router = APIRouter()
-
-app = FastAPI(title="Knowledge API") # If running standalone for now
+# Endpoints live on a router so the knowledge and graph APIs can be served
+# from one application (see sc/main.py). `app` below the endpoints mounts the
+# same router for running the knowledge API on its own.
+router = APIRouter()
 
 # In-memory storage for Knowledge Units
 knowledge_units_db: Dict[str, KnowledgeUnit] = {}
@@ -32,6 +27,13 @@ class KUDefinition(BaseModel):
     prompt: str
     context: Dict[str, Any] = {}
 
+class KUBatchRequest(BaseModel):
+    ku_ids: List[str]
+
+class KUBatchResponse(BaseModel):
+    units: List[KnowledgeUnit]
+    missing_ids: List[str]
+
 
 def get_request_count_for_ip(ip: str) -> int:
     """
@@ -48,8 +50,7 @@ def record_request_for_ip(ip: str):
     """
     rate_tracker[ip].append(time.time())
 
-# @router.post("/units", response_model=KnowledgeUnit, status_code=201)
-@app.post("/api/knowledge/units", response_model=KnowledgeUnit, status_code=201)
+@router.post("/units", response_model=KnowledgeUnit, status_code=201)
 async def create_knowledge_unit(definition: KUDefinition, request: Request):
     """
     Creates a new Knowledge Unit based on a prompt and context.
@@ -88,8 +89,7 @@ async def create_knowledge_unit(definition: KUDefinition, request: Request):
 
     return ku
 
-# @router.get("/units/{ku_id}", response_model=KnowledgeUnit)
-@app.get("/api/knowledge/units/{ku_id}", response_model=KnowledgeUnit)
+@router.get("/units/{ku_id}", response_model=KnowledgeUnit)
 async def get_knowledge_unit(ku_id: str, request: Request):
     """
     Retrieves a specific Knowledge Unit by its ID.
@@ -102,9 +102,30 @@ async def get_knowledge_unit(ku_id: str, request: Request):
     #     raise HTTPException(status_code=429, detail="Too many requests.")
     # record_request_for_ip(client_ip)
 
-    if ku_id not in knowledge_units_db:
+    try:
+        return knowledge_units_db[ku_id]
+    except KeyError:
         raise HTTPException(status_code=404, detail=f"Knowledge Unit with ID '{ku_id}' not found.")
-    return knowledge_units_db[ku_id]
+
+@router.post("/units/batch", response_model=KUBatchResponse)
+async def get_knowledge_units_batch(batch: KUBatchRequest):
+    """
+    Retrieves several Knowledge Units in one round trip.
+    Units are returned in request order; unknown IDs are listed in `missing_ids`
+    instead of failing the whole batch.
+    """
+    units = []
+    missing_ids = []
+    for ku_id in batch.ku_ids:
+        ku = knowledge_units_db.get(ku_id)
+        if ku is None:
+            missing_ids.append(ku_id)
+        else:
+            units.append(ku)
+    return KUBatchResponse(units=units, missing_ids=missing_ids)
+
+app = FastAPI(title="Knowledge API")
+app.include_router(router, prefix="/api/knowledge", tags=["knowledge"])
 
 # To run this API (example using uvicorn):
 # uvicorn sc.api.knowledge:app --reload --port 8000
@@ -116,6 +137,11 @@ async def get_knowledge_unit(ku_id: str, request: Request):
 #
 # Example GET request using curl:
 # curl -X GET "http://127.0.0.1:8000/api/knowledge/units/{ku_id_from_post_response}"
+#
+# Example batch POST request using curl:
+# curl -X POST "http://127.0.0.1:8000/api/knowledge/units/batch" \
+# -H "Content-Type: application/json" \
+# -d '{"ku_ids": ["{ku_id_1}", "{ku_id_2}"]}'
 
 # For simplicity, the `is_under_attack` function in `flowshield` uses its own
 # MAX_REQUESTS_PER_WINDOW. Here, we are managing the window and count explicitly
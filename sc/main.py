@@ -0,0 +1,14 @@
+from fastapi import FastAPI
+
+from sc.api import graph, knowledge
+
+# Combined application serving both APIs from a single process and port,
+# so clients can reuse one connection pool for knowledge and graph calls.
+# The per-module `knowledge.app` and `graph.app` remain available for
+# running either API on its own.
+app = FastAPI(title="Sapiens Coin API")
+app.include_router(knowledge.router, prefix="/api/knowledge", tags=["knowledge"])
+app.include_router(graph.router, prefix="/api/graph", tags=["graph"])
+
+# To run the combined API (example using uvicorn):
+# uvicorn sc.main:app --reload --port 8000
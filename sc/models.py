@@ -1,8 +1,10 @@
 from typing import List, Any
 from dataclasses import dataclass, field
+import json
+import os
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class KnowledgeUnit:
     """
     Represents a fundamental unit of knowledge in the Sapiens Coin system.
@@ -10,7 +12,7 @@ class KnowledgeUnit:
     quantum_fingerprint: str
     entropy_signature: float
     linked_ku_ids: List[str] = field(default_factory=list)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
     tags: List[str] = field(default_factory=list)
     data: Any = None
 
@@ -18,7 +20,9 @@ class KnowledgeUnit:
         # For now, quantum_fingerprint is a placeholder.
         # In a real scenario, this would involve a quantum-derived hash.
         if not self.quantum_fingerprint:
-            self.quantum_fingerprint = f"qfp_{uuid.uuid4().hex[:16]}"
+            # 8 random bytes give the same 16 hex chars as uuid4().hex[:16]
+            # without building (and mostly discarding) a UUID object.
+            self.quantum_fingerprint = f"qfp_{os.urandom(8).hex()}"
 
         # Entropy signature would be calculated based on the information density of 'data'.
         # Placeholder for now.
@@ -27,7 +31,6 @@ class KnowledgeUnit:
             if isinstance(self.data, str):
                 self.entropy_signature = float(len(self.data)) # Simplistic placeholder
             elif isinstance(self.data, (dict, list)):
-                import json
                 self.entropy_signature = float(len(json.dumps(self.data))) # Simplistic placeholder
         elif not isinstance(self.entropy_signature, float):
             # Ensure it's a float if provided
@@ -39,5 +42,4 @@ class KnowledgeUnit:
                 if isinstance(self.data, str):
                     self.entropy_signature = float(len(self.data))
                 elif isinstance(self.data, (dict, list)):
-                    import json
                     self.entropy_signature = float(len(json.dumps(self.data)))
@@ -2,6 +2,10 @@
 # In a real system, this might use a more sophisticated mechanism like Redis,
 # distributed counters, or a dedicated rate-limiting service.
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 # Define a simple threshold for demonstration purposes
 MAX_REQUESTS_PER_WINDOW = 100  # Example: 100 requests allowed
 # Window duration is implicitly handled by how `request_count` is managed by the caller.
@@ -22,7 +26,7 @@ def is_under_attack(ip: str, request_count: int) -> bool:
     # Simple check: if request_count exceeds the threshold, consider it an attack.
     # The 'ip' argument is included for future enhancements (e.g., per-IP thresholds, logging).
     if request_count > MAX_REQUESTS_PER_WINDOW:
-        print(f"Rate limit exceeded for IP {ip}: {request_count} requests > {MAX_REQUESTS_PER_WINDOW}")
+        logger.warning("Rate limit exceeded for IP %s: %s requests > %s", ip, request_count, MAX_REQUESTS_PER_WINDOW)
         return True
     return False
 
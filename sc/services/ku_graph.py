@@ -1,16 +1,27 @@
+import logging
 from typing import Dict, List, Tuple, Optional
 
+logger = logging.getLogger(__name__)
+
 # In-memory storage for the Knowledge Unit graph.
 # Structure:
 # {
-# "ku_id_1": [("ku_id_2", 0.8), ("ku_id_3", 0.5)], # from_ku_id_1 links to ku_id_2 with weight 0.8
-# "ku_id_2": [("ku_id_4", 0.9)]
+# "ku_id_1": {"ku_id_2": 0.8, "ku_id_3": 0.5}, # from_ku_id_1 links to ku_id_2 with weight 0.8
+# "ku_id_2": {"ku_id_4": 0.9}
 # }
 # This represents a directed graph where edges have weights.
+# Outgoing links are keyed by target ID so adding or updating a link is O(1)
+# instead of a scan over every link of the source KU. Dicts keep insertion
+# order, so links are still reported in the order they were first added.
 # We could also store reverse links if needed for quick lookups,
 # or use a more sophisticated graph library for larger datasets.
 
-ku_links: Dict[str, List[Tuple[str, float]]] = {}
+ku_links: Dict[str, Dict[str, float]] = {}
+
+# Incremented on every change to ku_links, so readers that cache views of the
+# graph (e.g. the graph API's response cache) can tell when they are stale.
+# Code that mutates ku_links must go through add_link/clear_links to bump it.
+_version = 0
 
 # Optional: To ensure KUs exist before linking, we might need a reference
 # to the main KU database or a function to check existence.
@@ -29,8 +40,10 @@ def add_link(from_ku_id: str, to_ku_id: str, weight: float) -> bool:
     Returns:
         bool: True if the link was added or updated, False otherwise (e.g., invalid weight).
     """
+    global _version
+
     if not (0.0 <= weight <= 1.0): # Assuming weight is normalized between 0 and 1
-        print(f"Error: Link weight must be between 0.0 and 1.0. Received: {weight}")
+        logger.warning("Link weight must be between 0.0 and 1.0. Received: %s", weight)
         return False
 
     # Optional: Check if KUs exist
@@ -38,22 +51,42 @@ def add_link(from_ku_id: str, to_ku_id: str, weight: float) -> bool:
     #     print(f"Error: One or both KU IDs do not exist: {from_ku_id}, {to_ku_id}")
     #     return False
 
-    if from_ku_id not in ku_links:
-        ku_links[from_ku_id] = []
+    outgoing = ku_links.setdefault(from_ku_id, {})
 
-    # Check if the link already exists to update weight, or add new
-    existing_link_index = -1
-    for i, (target_id, _) in enumerate(ku_links[from_ku_id]):
-        if target_id == to_ku_id:
-            existing_link_index = i
-            break
-
-    if existing_link_index != -1:
-        ku_links[from_ku_id][existing_link_index] = (to_ku_id, weight)
-        print(f"Updated link from {from_ku_id} to {to_ku_id} with new weight {weight}")
+    # Updating an existing key keeps its position, so the link order is unchanged
+    if to_ku_id in outgoing:
+        logger.debug("Updated link from %s to %s with new weight %s", from_ku_id, to_ku_id, weight)
     else:
-        ku_links[from_ku_id].append((to_ku_id, weight))
-        print(f"Added link from {from_ku_id} to {to_ku_id} with weight {weight}")
+        logger.debug("Added link from %s to %s with weight %s", from_ku_id, to_ku_id, weight)
+    outgoing[to_ku_id] = weight
+    _version += 1
+
+    return True
+
+def add_links_bulk(links: List[Tuple[str, str, float]]) -> bool:
+    """
+    Adds or updates many directed links in one call.
+
+    All weights are checked before the graph is touched, so either every link
+    is applied or none is. The graph version is bumped once for the whole batch.
+
+    Args:
+        links (List[Tuple[str, str, float]]): (from_ku_id, to_ku_id, weight) triples.
+
+    Returns:
+        bool: True if all links were added or updated, False if any weight was invalid.
+    """
+    global _version
+
+    for _, _, weight in links:
+        if not (0.0 <= weight <= 1.0):
+            logger.warning("Link weight must be between 0.0 and 1.0. Received: %s", weight)
+            return False
+
+    for from_ku_id, to_ku_id, weight in links:
+        ku_links.setdefault(from_ku_id, {})[to_ku_id] = weight
+    _version += 1
+    logger.debug("Added or updated %s links in bulk", len(links))
 
     return True
 
@@ -68,13 +101,30 @@ def get_links_from(ku_id: str) -> Optional[List[Tuple[str, float]]]:
         Optional[List[Tuple[str, float]]]: A list of (target_ku_id, weight) tuples,
                                            or None if the KU has no outgoing links or doesn't exist.
     """
-    return ku_links.get(ku_id)
+    outgoing = ku_links.get(ku_id)
+    if outgoing is None:
+        return None
+    return list(outgoing.items())
 
 def get_all_links() -> Dict[str, List[Tuple[str, float]]]:
     """
-    Returns the entire graph.
+    Returns the entire graph as {from_ku_id: [(target_ku_id, weight), ...]}.
+    """
+    return {from_ku_id: list(outgoing.items()) for from_ku_id, outgoing in ku_links.items()}
+
+def get_graph_version() -> int:
+    """
+    Returns a counter that changes whenever the graph is modified.
+    """
+    return _version
+
+def clear_links() -> None:
+    """
+    Removes every link from the graph.
     """
-    return ku_links
+    global _version
+    ku_links.clear()
+    _version += 1
 
 if __name__ == '__main__':
     # Example Usage
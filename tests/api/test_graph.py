@@ -23,7 +23,7 @@ class TestGraphAPI(unittest.TestCase):
         Clear any existing graph data before each test.
         """
         self.client = TestClient(graph_app)
-        ku_graph.ku_links.clear() # Clear graph links
+        ku_graph.clear_links() # Clear graph links (also invalidates cached responses)
         # If KU existence checks were active in graph API, also clear knowledge_units_db
         # knowledge_units_db.clear()
         # And potentially pre-populate with some KUs for testing link creation.
@@ -37,7 +37,7 @@ class TestGraphAPI(unittest.TestCase):
         """
         Clean up after tests if necessary.
         """
-        ku_graph.ku_links.clear()
+        ku_graph.clear_links()
         # knowledge_units_db.clear()
 
     def test_link_knowledge_units_success(self):
@@ -113,6 +113,51 @@ class TestGraphAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertIn("Cannot link a Knowledge Unit to itself", response.json()["detail"])
 
+    def test_link_knowledge_units_bulk_success(self):
+        """
+        Test creating and updating several links in one bulk request.
+        """
+        self.client.post("/api/graph/link", json={"from_ku_id": "ku_b1", "to_ku_id": "ku_b2", "weight": 0.1})
+        response = self.client.post(
+            "/api/graph/links_bulk",
+            json=[
+                {"from_ku_id": "ku_b1", "to_ku_id": "ku_b2", "weight": 0.9}, # Update
+                {"from_ku_id": "ku_b1", "to_ku_id": "ku_b3", "weight": 0.5},
+                {"from_ku_id": "ku_b2", "to_ku_id": "ku_b3", "weight": 0.3}
+            ]
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["created"], 3)
+
+        self.assertEqual(ku_graph.get_links_from("ku_b1"), [("ku_b2", 0.9), ("ku_b3", 0.5)])
+        self.assertEqual(ku_graph.get_links_from("ku_b2"), [("ku_b3", 0.3)])
+
+    def test_link_knowledge_units_bulk_rejects_self_link(self):
+        """
+        Test that a self-link anywhere in the batch rejects the whole batch.
+        """
+        response = self.client.post(
+            "/api/graph/links_bulk",
+            json=[
+                {"from_ku_id": "ku_b1", "to_ku_id": "ku_b2", "weight": 0.5},
+                {"from_ku_id": "ku_self", "to_ku_id": "ku_self", "weight": 0.5}
+            ]
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("ku_self", response.json()["detail"])
+        self.assertIsNone(ku_graph.get_links_from("ku_b1"))
+
+    def test_link_knowledge_units_bulk_invalid_weight(self):
+        """
+        Test bulk link creation with an out-of-range weight (should be caught by Pydantic).
+        """
+        response = self.client.post(
+            "/api/graph/links_bulk",
+            json=[{"from_ku_id": "ku_b1", "to_ku_id": "ku_b2", "weight": 1.5}]
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertIsNone(ku_graph.get_links_from("ku_b1"))
+
     def test_get_outgoing_links_success(self):
         """
         Test retrieving outgoing links for a KU.
@@ -133,6 +178,25 @@ class TestGraphAPI(unittest.TestCase):
         ]
         self.assertCountEqual(data["links"], expected_links) # Checks elements regardless of order
 
+    def test_get_outgoing_links_reflects_updates(self):
+        """
+        Test that cached link responses are refreshed after the graph changes.
+        """
+        self.client.post("/api/graph/link", json={"from_ku_id": "ku_cached", "to_ku_id": "ku_t1", "weight": 0.4})
+        first = self.client.get("/api/graph/links/ku_cached").json()
+        self.assertEqual(first["links"], [{"to_ku_id": "ku_t1", "weight": 0.4}])
+
+        self.client.post("/api/graph/link", json={"from_ku_id": "ku_cached", "to_ku_id": "ku_t1", "weight": 0.7})
+        self.client.post("/api/graph/link", json={"from_ku_id": "ku_cached", "to_ku_id": "ku_t2", "weight": 0.2})
+        second = self.client.get("/api/graph/links/ku_cached").json()
+        self.assertEqual(second["links"], [
+            {"to_ku_id": "ku_t1", "weight": 0.7},
+            {"to_ku_id": "ku_t2", "weight": 0.2}
+        ])
+
+        all_links = self.client.get("/api/graph/all_links").json()
+        self.assertEqual(all_links, {"ku_cached": [["ku_t1", 0.7], ["ku_t2", 0.2]]})
+
     def test_get_outgoing_links_no_links(self):
         """
         Test retrieving links for a KU that exists (implicitly, by querying) but has no outgoing links.
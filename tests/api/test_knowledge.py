@@ -0,0 +1,59 @@
+import unittest
+from fastapi.testclient import TestClient
+
+from sc.api.knowledge import app as knowledge_app
+from sc.api.knowledge import knowledge_units_db
+from sc.models import KnowledgeUnit
+
+
+class TestKnowledgeAPI(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Set up a TestClient and pre-populate the in-memory KU store.
+        """
+        self.client = TestClient(knowledge_app)
+        knowledge_units_db.clear()
+        knowledge_units_db["ku_A"] = KnowledgeUnit(id="ku_A", quantum_fingerprint="qfpA", entropy_signature=1.0)
+        knowledge_units_db["ku_B"] = KnowledgeUnit(id="ku_B", quantum_fingerprint="qfpB", entropy_signature=2.0)
+
+    def tearDown(self):
+        knowledge_units_db.clear()
+
+    def test_get_knowledge_unit_success(self):
+        """
+        Test retrieving a single stored KU.
+        """
+        response = self.client.get("/api/knowledge/units/ku_A")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], "ku_A")
+
+    def test_get_knowledge_unit_not_found(self):
+        """
+        Test retrieving a KU that does not exist.
+        """
+        response = self.client.get("/api/knowledge/units/ku_missing")
+        self.assertEqual(response.status_code, 404)
+
+    def test_get_knowledge_units_batch(self):
+        """
+        Test fetching several KUs in one request, preserving request order.
+        """
+        response = self.client.post("/api/knowledge/units/batch", json={"ku_ids": ["ku_B", "ku_A"]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([unit["id"] for unit in data["units"]], ["ku_B", "ku_A"])
+        self.assertEqual(data["missing_ids"], [])
+
+    def test_get_knowledge_units_batch_with_missing(self):
+        """
+        Test that unknown IDs are reported rather than failing the batch.
+        """
+        response = self.client.post("/api/knowledge/units/batch", json={"ku_ids": ["ku_A", "ku_missing"]})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([unit["id"] for unit in data["units"]], ["ku_A"])
+        self.assertEqual(data["missing_ids"], ["ku_missing"])
+
+if __name__ == '__main__':
+    unittest.main()